@@ -1,7 +1,19 @@
 import pygame
 import sys
 import random
-from tkinter import messagebox, Tk
+import time
+import numpy as np
+
+try:
+    from numba import njit, types
+    from numba.typed import Dict
+except ImportError:  # Numba is optional, the AI search then runs as plain Python
+    types = Dict = None
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
 
 # Initialize Pygame
 pygame.init()
@@ -19,6 +31,23 @@ BLUE = (0, 0, 255)
 GRAY = (128, 128, 128)
 YELLOW = (255, 255, 0)
 
+# Cell values of the array board used by the AI search
+EMPTY, RED_PIECE, BLUE_PIECE = 0, 1, 2
+PIECE_CODES = {RED: RED_PIECE, BLUE: BLUE_PIECE}
+
+# Move directions (row, col) for each side: forward, forward diagonals and sideways
+RED_DIRS = ((-1, 0), (-1, -1), (-1, 1), (0, -1), (0, 1))
+BLUE_DIRS = ((1, 0), (1, -1), (1, 1), (0, -1), (0, 1))
+MOVE_DIRS = np.array((RED_DIRS, BLUE_DIRS), dtype=np.int64)  # Indexed by piece code - 1 in the compiled search
+
+# Kinds of scores stored in the transposition table
+TT_EXACT, TT_LOWER, TT_UPPER = 0, 1, 2
+
+# Iterative deepening limits for the AI's move search
+MIN_DEPTH = 3  # Search depth always completed, regardless of the time budget
+MAX_DEPTH = 8  # Deepest search below each AI move
+AI_TIME_BUDGET = 0.2  # Seconds after which a search deeper than MIN_DEPTH is abandoned
+
 # Initialize the screen with the given dimensions
 screen = pygame.display.set_mode((WIDTH, HEIGHT))
 pygame.display.set_caption('Checkers-like Game')
@@ -29,7 +58,55 @@ FONT = pygame.font.SysFont('Arial', 24)
 # Define the reshuffle button properties
 RESHUFFLE_BTN = pygame.Rect(WIDTH // 2 - 50, HEIGHT - 50, 100, 40)
 RESHUFFLE_BTN_COLOR = (200, 200, 200)
-RESHUFFLE_BTN_TEXT = FONT.render('Reshuffle', True, BLACK)
+RESHUFFLE_BTN_TEXT = FONT.render('Reshuffle', True, BLACK).convert_alpha()
+
+# Reshuffle button with its label, pre-rendered so redrawing it is a plain blit
+RESHUFFLE_BTN_SURF = pygame.Surface(RESHUFFLE_BTN.size).convert()
+RESHUFFLE_BTN_SURF.fill(RESHUFFLE_BTN_COLOR)
+RESHUFFLE_BTN_SURF.blit(RESHUFFLE_BTN_TEXT, (5, 5))
+
+# Coin toss announcement for each starting player
+START_TEXTS = {RED: FONT.render("After tossing the coin, Red starts!", True, BLACK).convert_alpha(),
+               BLUE: FONT.render("After tossing the coin, Blue starts!", True, BLACK).convert_alpha()}
+
+# Area below the board holding the reshuffle button and counters
+PANEL_RECT = pygame.Rect(0, HEIGHT - 50, WIDTH, 50)
+FPS = 60  # Frame rate cap for the game loop
+EVENT_WAIT_MS = 50  # How long the game loop sleeps waiting for input on the player's turn
+MESSAGE_MS = 2000  # How long the start and game over messages stay on screen
+
+def make_tile(color):
+    """
+    Creates a square tile surface filled with a single color.
+
+    Parameters:
+    color (tuple): Fill color of the tile.
+
+    Returns:
+    Surface: A SQUARE_SIZE x SQUARE_SIZE surface in the display's pixel format.
+    """
+    tile = pygame.Surface((SQUARE_SIZE, SQUARE_SIZE)).convert()
+    tile.fill(color)
+    return tile
+
+# Prebuilt board tiles, blitted in one batch instead of drawing a rect per square
+TILE_BLACK = make_tile(BLACK)
+TILE_WHITE = make_tile(WHITE)
+TILE_MINE = make_tile(YELLOW)
+
+# Static checkerboard pattern, rendered once and blitted every frame
+BOARD_BG = pygame.Surface((WIDTH, HEIGHT - 50)).convert()
+
+def _init_background():
+    """
+    Renders the black and white squares of the board onto BOARD_BG.
+    """
+    for row in range(ROWS):
+        for col in range(COLS):
+            tile = TILE_BLACK if (row + col) % 2 == 0 else TILE_WHITE
+            BOARD_BG.blit(tile, (col * SQUARE_SIZE, row * SQUARE_SIZE))
+
+_init_background()
 
 class Piece:
     """
@@ -50,27 +127,15 @@ class Piece:
         self.row = row
         self.col = col
         self.color = color
-        self.x = 0
-        self.y = 0
-        self.calc_pos()  # Calculate the piece's position on the screen
 
-    def calc_pos(self):
+    def blit_item(self):
         """
-        Calculates the screen position of the piece based on its row and column.
-        """
-        self.x = SQUARE_SIZE * self.col + SQUARE_SIZE // 2
-        self.y = SQUARE_SIZE * self.row + SQUARE_SIZE // 2
+        Gets the image of the piece and where to draw it, as an entry for Surface.blits.
 
-    def draw(self, screen):
+        Returns:
+        tuple: The piece's surface and the top-left screen position of its square.
         """
-        Draws the piece on the screen.
-
-        Parameters:
-        screen (Surface): The Pygame surface to draw on.
-        """
-        radius = SQUARE_SIZE // 2 - self.PADDING
-        pygame.draw.circle(screen, GRAY, (self.x, self.y), radius + self.OUTLINE)  # Draw the piece's outline
-        pygame.draw.circle(screen, self.color, (self.x, self.y), radius)  # Draw the piece's color
+        return PIECE_SURFS[self.color], (self.col * SQUARE_SIZE, self.row * SQUARE_SIZE)
 
     def move(self, row, col):
         """
@@ -82,7 +147,26 @@ class Piece:
         """
         self.row = row
         self.col = col
-        self.calc_pos()  # Recalculate the piece's position on the screen
+
+def make_piece_surface(color):
+    """
+    Creates a transparent square surface with an outlined piece drawn in its center.
+
+    Parameters:
+    color (tuple): Color of the piece.
+
+    Returns:
+    Surface: A SQUARE_SIZE x SQUARE_SIZE surface with per-pixel alpha in the display's pixel format.
+    """
+    surf = pygame.Surface((SQUARE_SIZE, SQUARE_SIZE), pygame.SRCALPHA).convert_alpha()
+    center = (SQUARE_SIZE // 2, SQUARE_SIZE // 2)
+    radius = SQUARE_SIZE // 2 - Piece.PADDING
+    pygame.draw.circle(surf, GRAY, center, radius + Piece.OUTLINE)  # Draw the piece's outline
+    pygame.draw.circle(surf, color, center, radius)  # Draw the piece's color
+    return surf
+
+# Prebuilt piece images, blitted instead of drawing two circles per piece every frame
+PIECE_SURFS = {RED: make_piece_surface(RED), BLUE: make_piece_surface(BLUE)}
 
 def create_board():
     """
@@ -103,27 +187,103 @@ def create_board():
                 board[row].append(0)  # Empty cells
     return board
 
-def generate_mines(board, num_mines=4):
+def board_to_array(board):
+    """
+    Converts the board of Piece objects to a compact array for the AI search.
+
+    Parameters:
+    board (list): The current state of the board.
+
+    Returns:
+    ndarray: A ROWS x COLS int8 array holding EMPTY, RED_PIECE or BLUE_PIECE.
+    """
+    arr = np.zeros((ROWS, COLS), dtype=np.int8)
+    for row in range(ROWS):
+        for col in range(COLS):
+            piece = board[row][col]
+            if piece != 0:
+                arr[row, col] = PIECE_CODES[piece.color]
+    return arr
+
+def group_pieces(board):
+    """
+    Collects the pieces on the board by color.
+
+    Parameters:
+    board (list): The current state of the board.
+
+    Returns:
+    dict: Maps RED and BLUE to lists of their pieces still on the board.
+    """
+    pieces_by_color = {RED: [], BLUE: []}
+    for row in board:
+        for piece in row:
+            if piece != 0:
+                pieces_by_color[piece.color].append(piece)
+    return pieces_by_color
+
+def move_piece(board, board_arr, pieces_by_color, piece, row, col):
+    """
+    Moves a piece on the board, its array copy and the piece lists, capturing any piece at the destination.
+
+    Parameters:
+    board (list): The current state of the board.
+    board_arr (ndarray): The array copy of the board.
+    pieces_by_color (dict): Lists of the pieces on the board by color.
+    piece (Piece): The piece to move.
+    row (int): New row position on the board.
+    col (int): New column position on the board.
+    """
+    captured = board[row][col]
+    if captured != 0:
+        pieces_by_color[captured.color].remove(captured)
+    board[row][col] = piece
+    board[piece.row][piece.col] = 0
+    board_arr[row, col] = board_arr[piece.row, piece.col]
+    board_arr[piece.row, piece.col] = EMPTY
+    piece.move(row, col)
+
+def generate_mines(board, num_mines=4, forbidden=frozenset()):
     """
     Randomly generates a set of mines on the board.
 
     Parameters:
     board (list): The current state of the board.
     num_mines (int): Number of mines to generate.
+    forbidden (set): Coordinates where no mine may be placed.
 
     Returns:
-    set: A set of coordinates where mines are placed.
+    set: A set of coordinates where mines are placed, fewer than num_mines if the single greedy
+    pass over the shuffled squares runs out of squares that keep mines apart.
     """
+    # Empty squares between the two back rows, visited once in random order
+    valid = [(row, col) for row in range(1, ROWS - 1) for col in range(COLS)
+             if board[row][col] == 0 and (row, col) not in forbidden]
+    random.shuffle(valid)
     mines = set()
-    while len(mines) < num_mines:
-        row = random.randint(1, ROWS - 2)
-        col = random.randint(0, COLS - 1)
-        if board[row][col] == 0:
-            # Ensure no two mines are adjacent in the same row
-            if all((row, col + offset) not in mines for offset in [-1, 1]):
-                mines.add((row, col))
+    for row, col in valid:
+        if len(mines) == num_mines:
+            break
+        # Ensure no two mines are adjacent in the same row
+        if all((row, col + offset) not in mines for offset in [-1, 1]):
+            mines.add((row, col))
     return mines
 
+def mines_to_mask(mines):
+    """
+    Packs a set of mine coordinates into a bitmask with one bit per square.
+
+    Parameters:
+    mines (set): The set of mine coordinates.
+
+    Returns:
+    int: A bitmask where bit row * COLS + col is set for every mine.
+    """
+    mask = 0
+    for row, col in mines:
+        mask |= 1 << (row * COLS + col)
+    return mask
+
 def draw_board(screen, board, mines, turn, red_shuffles, blue_shuffles):
     """
     Draws the game board including pieces and mines.
@@ -138,23 +298,35 @@ def draw_board(screen, board, mines, turn, red_shuffles, blue_shuffles):
     """
     screen.fill(WHITE)  # Fill the screen with white background
 
-    for row in range(ROWS):
-        for col in range(COLS):
-            if (row, col) in mines:
-                pygame.draw.rect(screen, YELLOW, (col * SQUARE_SIZE, row * SQUARE_SIZE, SQUARE_SIZE, SQUARE_SIZE))  # Draw mines
-            elif (row + col) % 2 == 0:
-                pygame.draw.rect(screen, BLACK, (col * SQUARE_SIZE, row * SQUARE_SIZE, SQUARE_SIZE, SQUARE_SIZE))  # Draw black squares
-            else:
-                pygame.draw.rect(screen, WHITE, (col * SQUARE_SIZE, row * SQUARE_SIZE, SQUARE_SIZE, SQUARE_SIZE))  # Draw white squares
-
-    for row in range(ROWS):
-        for col in range(COLS):
-            piece = board[row][col]
-            if piece != 0:
-                piece.draw(screen)  # Draw each piece on the board
+    # Draw the cached checkerboard, then mines, then pieces from prebuilt surfaces
+    # in a single Surface.blits call, so no squares or circles are drawn per frame
+    blit_list = [(BOARD_BG, (0, 0))]
+    blit_list += [(TILE_MINE, (col * SQUARE_SIZE, row * SQUARE_SIZE)) for (row, col) in mines]
+    blit_list += [piece.blit_item() for row in board for piece in row if piece != 0]
+    screen.blits(blit_list, doreturn=0)
 
     draw_reshuffle_button(screen, turn, red_shuffles, blue_shuffles)  # Draw the reshuffle button
 
+_SHUF_CACHE = {}  # Rendered reshuffle counters keyed by (color, count)
+
+def _shuf_surf(color, count):
+    """
+    Gets the rendered reshuffle counter text for a player, rendering it only once per count.
+
+    Parameters:
+    color (tuple): The color of the player.
+    count (int): Number of shuffles left for the player.
+
+    Returns:
+    Surface: The rendered counter text.
+    """
+    key = (color, count)
+    surf = _SHUF_CACHE.get(key)
+    if surf is None:
+        surf = FONT.render(f'{"Red" if color == RED else "Blue"} Shuffles: {count}', True, color).convert_alpha()
+        _SHUF_CACHE[key] = surf
+    return surf
+
 def draw_reshuffle_button(screen, turn, red_shuffles, blue_shuffles):
     """
     Draws the reshuffle button and displays the number of reshuffles left for each player.
@@ -165,14 +337,26 @@ def draw_reshuffle_button(screen, turn, red_shuffles, blue_shuffles):
     red_shuffles (int): Number of shuffles left for the red player.
     blue_shuffles (int): Number of shuffles left for the blue player.
     """
-    pygame.draw.rect(screen, RESHUFFLE_BTN_COLOR, RESHUFFLE_BTN)  # Draw the reshuffle button
-    screen.blit(RESHUFFLE_BTN_TEXT, (RESHUFFLE_BTN.x + 5, RESHUFFLE_BTN.y + 5))  # Draw the reshuffle button text
+    # Display the button and the remaining reshuffles for each player in one batched blit
+    red_text = _shuf_surf(RED, red_shuffles)
+    blue_text = _shuf_surf(BLUE, blue_shuffles)
+    screen.blits([(RESHUFFLE_BTN_SURF, RESHUFFLE_BTN.topleft),  # Draw the reshuffle button
+                  (red_text, (10, HEIGHT - 30)),  # Position red reshuffle text
+                  (blue_text, (WIDTH - blue_text.get_width() - 10, HEIGHT - 30))],  # Position blue reshuffle text
+                 doreturn=0)
 
-    # Display remaining reshuffles for each player
-    red_text = FONT.render(f'Red Shuffles: {red_shuffles}', True, RED)
-    blue_text = FONT.render(f'Blue Shuffles: {blue_shuffles}', True, BLUE)
-    screen.blit(red_text, (10, HEIGHT - 30))  # Position red reshuffle text
-    screen.blit(blue_text, (WIDTH - blue_text.get_width() - 10, HEIGHT - 30))  # Position blue reshuffle text
+def square_rect(row, col):
+    """
+    Gets the screen rectangle covered by a board square.
+
+    Parameters:
+    row (int): Row position on the board.
+    col (int): Column position on the board.
+
+    Returns:
+    Rect: The area of the screen occupied by the square.
+    """
+    return pygame.Rect(col * SQUARE_SIZE, row * SQUARE_SIZE, SQUARE_SIZE, SQUARE_SIZE)
 
 def get_row_col_from_mouse(pos):
     """
@@ -191,48 +375,48 @@ def get_row_col_from_mouse(pos):
 
 def show_message(message):
     """
-    Shows a message box with the game result.
+    Shows the game result in a box centered on the screen.
 
     Parameters:
     message (str): The message to display.
     """
-    root = Tk()
-    root.withdraw()  # Hide the root window
-    messagebox.showinfo("Game Over", message)  # Show the message box
-    try:
-        root.destroy()  # Close the root window
-    except:
-        pass
+    text = FONT.render(message, True, BLACK)
+    text_rect = text.get_rect(center=(WIDTH // 2, HEIGHT // 2))
+    box = text_rect.inflate(40, 20)
+    pygame.draw.rect(screen, WHITE, box)  # Draw the message box
+    pygame.draw.rect(screen, GRAY, box, 2)  # Draw the message box border
+    screen.blit(text, text_rect)
+    pygame.display.flip()  # Update the display
+    pygame.time.wait(MESSAGE_MS)  # Keep the message on screen before the game closes
 
-def check_win_condition(board):
+def check_win_condition(arr):
     """
     Checks if there is a winning condition on the board.
 
     Parameters:
-    board (list): The current state of the board.
+    arr (ndarray): The array copy of the board.
 
     Returns:
     str: A message indicating if the game is won or not.
     """
-    for col in range(COLS):
-        if isinstance(board[0][col], Piece) and board[0][col].color == RED:
-            return "You won!"  # Red pieces in the first row means red won
-        if isinstance(board[ROWS-1][col], Piece) and board[ROWS-1][col].color == BLUE:
-            return "You lost!"  # Blue pieces in the last row means blue won
+    if (arr[0] == RED_PIECE).any():
+        return "You won!"  # Red pieces in the first row means red won
+    if (arr[-1] == BLUE_PIECE).any():
+        return "You lost!"  # Blue pieces in the last row means blue won
     return None
 
-def check_no_pieces_left(board):
+def check_no_pieces_left(arr):
     """
     Checks if a player has lost all their pieces.
 
     Parameters:
-    board (list): The current state of the board.
+    arr (ndarray): The array copy of the board.
 
     Returns:
     str: A message indicating which player has lost all their pieces.
     """
-    red_pieces = sum(isinstance(piece, Piece) and piece.color == RED for row in board for piece in row)
-    blue_pieces = sum(isinstance(piece, Piece) and piece.color == BLUE for row in board for piece in row)
+    red_pieces = (arr == RED_PIECE).sum()
+    blue_pieces = (arr == BLUE_PIECE).sum()
     if red_pieces == 0:
         return "Red lost!"  # Red player has no pieces left
     if blue_pieces == 0:
@@ -250,158 +434,318 @@ def shuffle_mines(board, mines):
     Returns:
     set: A new set of mine coordinates.
     """
-    new_mines = generate_mines(board)
-    while len(new_mines & mines) > 0:
-        new_mines = generate_mines(board)  # Ensure no overlap with existing mines
-    return new_mines
+    return generate_mines(board, forbidden=mines)  # Ensure no overlap with existing mines
 
-def evaluate(board):
+def get_valid_moves(piece, board, mines_mask):
     """
-    Evaluates the board state for the minimax algorithm.
+    Gets all valid moves for a given piece on the board.
 
     Parameters:
+    piece (Piece): The piece to find moves for.
     board (list): The current state of the board.
+    mines_mask (int): Bitmask of the current mine coordinates.
 
     Returns:
-    int: The evaluation score of the board.
+    list: A list of valid moves for the piece, captures first, then forward and sideways moves.
     """
-    red_pieces = sum(isinstance(piece, Piece) and piece.color == RED for row in board for piece in row)
-    blue_pieces = sum(isinstance(piece, Piece) and piece.color == BLUE for row in board for piece in row)
-    return blue_pieces - red_pieces  # Positive score favors blue, negative favors red
+    directions = RED_DIRS if piece.color == RED else BLUE_DIRS
+    captures, quiet = [], []
+    for dr, dc in directions:
+        r, c = piece.row + dr, piece.col + dc
+        if 0 <= r < ROWS and 0 <= c < COLS and not mines_mask & (1 << (r * COLS + c)):
+            if board[r][c] == 0:
+                quiet.append((r, c))  # Empty cell is a valid move
+            elif board[r][c].color != piece.color:
+                captures.append((r, c))  # Opponent's piece can be captured
+    return captures + quiet
 
-def get_valid_moves(piece, board, mines):
+def get_array_moves(arr, row, col, mines_mask):
     """
-    Gets all valid moves for a given piece on the board.
+    Gets all valid moves for the piece at a given cell of the array board.
 
     Parameters:
-    piece (Piece): The piece to find moves for.
-    board (list): The current state of the board.
-    mines (set): The current set of mine coordinates.
+    arr (ndarray): The array copy of the board.
+    row (int): Row of the piece.
+    col (int): Column of the piece.
+    mines_mask (int): Bitmask of the current mine coordinates.
+
+    Returns:
+    list: A list of valid moves for the piece, captures first, then forward and sideways moves.
+    """
+    code = arr[row, col]
+    directions = RED_DIRS if code == RED_PIECE else BLUE_DIRS
+    captures, quiet = [], []
+    for dr, dc in directions:
+        r, c = row + dr, col + dc
+        if 0 <= r < ROWS and 0 <= c < COLS and not mines_mask & (1 << (r * COLS + c)):
+            if arr[r, c] == EMPTY:
+                quiet.append((r, c))  # Empty cell is a valid move
+            elif arr[r, c] != code:
+                captures.append((r, c))  # Opponent's piece can be captured
+    return captures + quiet
+
+def new_transposition_table():
+    """
+    Creates an empty transposition table for the minimax search.
+
+    Returns:
+    dict: Maps (board key, depth, maximizing player, mines mask) to a (score, TT_* kind) pair.
+    """
+    if Dict is None:
+        return {}
+    return Dict.empty(key_type=types.UniTuple(types.int64, 4),
+                      value_type=types.Tuple((types.float64, types.int64)))
+
+@njit(cache=True)
+def _board_key(arr):
+    """
+    Packs the array board into a single integer for the transposition table.
+
+    Parameters:
+    arr (ndarray): The array copy of the board.
+
+    Returns:
+    int: The board with two bits per square, in row-major order.
+    """
+    key = 0
+    for row in range(ROWS):
+        for col in range(COLS):
+            key = key * 4 + int(arr[row, col])
+    return key
+
+@njit(cache=True)
+def _piece_lists(arr):
+    """
+    Builds the piece lists of the compiled search from the array board.
+
+    Parameters:
+    arr (ndarray): The array copy of the board.
+
+    Returns:
+    tuple: pieces (ndarray), a 3 x COLS int64 array whose row RED_PIECE or BLUE_PIECE
+    holds the square indices (row * COLS + col) of that side's pieces, and counts
+    (ndarray), an int64 array whose entry RED_PIECE or BLUE_PIECE is how many of the
+    leading entries in that row are live pieces.
+    """
+    pieces = np.zeros((3, COLS), dtype=np.int64)  # Each side starts with one row of pieces
+    counts = np.zeros(3, dtype=np.int64)
+    for row in range(ROWS):
+        for col in range(COLS):
+            code = arr[row, col]
+            if code != EMPTY:
+                pieces[code, counts[code]] = row * COLS + col
+                counts[code] += 1
+    return pieces, counts
+
+@njit(cache=True)
+def _store_score(table, key, score, alpha, beta):
+    """
+    Records a search score in the transposition table and returns it.
+
+    Parameters:
+    table (dict): Transposition table from new_transposition_table.
+    key (tuple): The (board key, depth, maximizing player, mines mask) of the position.
+    score (float): The score the search found for the position.
+    alpha (float): The alpha the position was searched with, before any table lookup.
+    beta (float): The beta the position was searched with, before any table lookup.
 
     Returns:
-    list: A list of valid moves for the piece.
+    float: The given score.
     """
-    if piece.color == RED:
-        directions = [(-1, 0), (-1, -1), (-1, 1), (0, -1), (0, 1)]  # Moves for red pieces
+    # A score outside the search window is only a bound on the true score
+    if score <= alpha:
+        table[key] = (score, TT_UPPER)
+    elif score >= beta:
+        table[key] = (score, TT_LOWER)
     else:
-        directions = [(1, 0), (1, -1), (1, 1), (0, -1), (0, 1)]  # Moves for blue pieces
-    valid_moves = []
-    for d in directions:
-        r, c = piece.row + d[0], piece.col + d[1]
-        if 0 <= r < ROWS and 0 <= c < COLS and (r, c) not in mines:
-            if board[r][c] == 0:
-                valid_moves.append((r, c))  # Empty cell is a valid move
-            elif board[r][c].color != piece.color:
-                valid_moves.append((r, c))  # Opponent's piece can be captured
-    return valid_moves
+        table[key] = (score, TT_EXACT)
+    return score
 
-def minimax(board, depth, alpha, beta, maximizing_player, mines):
+@njit(cache=True)
+def _minimax_jit(arr, pieces, counts, depth, alpha, beta, maximizing_player, mines_mask, table):
+    """
+    Compiled minimax search with alpha-beta pruning, called through minimax.
+
+    Moves are made and unmade in place on arr, pieces and counts, so all three
+    are back in their original state when the function returns.
+
+    Parameters:
+    arr (ndarray): The array copy of the board.
+    pieces (ndarray): Square indices of each side's pieces, as built by _piece_lists.
+    counts (ndarray): Number of live pieces of each side, as built by _piece_lists.
+    depth (int): The depth of the search tree.
+    alpha (float): The best value that the maximizer can guarantee.
+    beta (float): The best value that the minimizer can guarantee.
+    maximizing_player (bool): True if it's the maximizing (blue) player's turn, False otherwise.
+    mines_mask (int): Bitmask of the current mine coordinates.
+    table (dict): Transposition table from new_transposition_table.
+
+    Returns:
+    float: The best evaluation score for the current player, or a bound on it
+    when the score falls outside the alpha-beta window.
+    """
+    # Check for a win condition or if maximum depth is reached
+    if (arr[0] == RED_PIECE).any():
+        return -np.inf  # Red reached the first row, the minimizing player wins
+    if (arr[ROWS - 1] == BLUE_PIECE).any():
+        return np.inf  # Blue reached the last row, the maximizing player wins
+    if depth == 0:
+        return float(counts[BLUE_PIECE] - counts[RED_PIECE])  # Positive score favors blue, negative favors red
+
+    # Reuse the score of a position already searched through another move order
+    key = (_board_key(arr), depth, 1 if maximizing_player else 0, mines_mask)
+    alpha_orig, beta_orig = alpha, beta
+    if key in table:
+        score, kind = table[key]
+        if kind == TT_EXACT:
+            return score
+        if kind == TT_LOWER:
+            alpha = max(alpha, score)
+        else:
+            beta = min(beta, score)
+        if beta <= alpha:
+            return score
+
+    code = BLUE_PIECE if maximizing_player else RED_PIECE
+    opponent = RED_PIECE if maximizing_player else BLUE_PIECE
+    goal_row = ROWS - 1 if maximizing_player else 0
+    directions = MOVE_DIRS[code - 1]
+    best_eval = -np.inf if maximizing_player else np.inf
+    # Search captures of every piece first, then quiet moves, so cut-offs come early
+    for target in (opponent, EMPTY):
+        for k in range(counts[code]):
+            src = pieces[code, k]
+            row, col = src // COLS, src % COLS
+            for i in range(directions.shape[0]):
+                r = row + directions[i, 0]
+                c = col + directions[i, 1]
+                if r < 0 or r >= ROWS or c < 0 or c >= COLS:
+                    continue
+                if arr[r, c] != target or mines_mask & (1 << (r * COLS + c)):
+                    continue
+                if r == goal_row:
+                    return np.inf if maximizing_player else -np.inf  # Winning move, nothing can beat it
+                # Make the move in place, search it, then unmake it
+                dst = r * COLS + c
+                if target == opponent:
+                    # Remove the captured piece by swapping the last opponent piece into its slot
+                    j = 0
+                    while pieces[opponent, j] != dst:
+                        j += 1
+                    counts[opponent] -= 1
+                    pieces[opponent, j] = pieces[opponent, counts[opponent]]
+                pieces[code, k] = dst
+                arr[r, c] = code
+                arr[row, col] = EMPTY
+                eval = _minimax_jit(arr, pieces, counts, depth - 1, alpha, beta, not maximizing_player, mines_mask, table)
+                arr[row, col] = code
+                arr[r, c] = target
+                pieces[code, k] = src
+                if target == opponent:
+                    pieces[opponent, counts[opponent]] = pieces[opponent, j]
+                    pieces[opponent, j] = dst
+                    counts[opponent] += 1
+                if maximizing_player:
+                    best_eval = max(best_eval, eval)
+                    alpha = max(alpha, eval)
+                else:
+                    best_eval = min(best_eval, eval)
+                    beta = min(beta, eval)
+                if beta <= alpha:
+                    return _store_score(table, key, best_eval, alpha_orig, beta_orig)  # Cut-off
+    return _store_score(table, key, best_eval, alpha_orig, beta_orig)
+
+def minimax(arr, depth, alpha, beta, maximizing_player, mines_mask, table=None):
     """
     Minimax algorithm with alpha-beta pruning to evaluate the best move.
 
     Parameters:
-    board (list): The current state of the board.
+    arr (ndarray): The array copy of the board.
     depth (int): The depth of the search tree.
     alpha (float): The best value that the maximizer can guarantee.
     beta (float): The best value that the minimizer can guarantee.
     maximizing_player (bool): True if it's the maximizing player's turn, False otherwise.
-    mines (set): The current set of mine coordinates.
+    mines_mask (int): Bitmask of the current mine coordinates.
+    table (dict): Transposition table from new_transposition_table, a fresh one if None.
 
     Returns:
-    int: The best evaluation score for the current player.
+    float: The best evaluation score for the current player.
     """
-    # Check for a win condition or if maximum depth is reached
-    win_message = check_win_condition(board)
-    if depth == 0 or win_message:
-        if win_message == "You won!":
-            return float('-inf')  # Maximizing player wins, return a very low score
-        elif win_message == "You lost!":
-            return float('inf')  # Minimizing player wins, return a very high score
-        return evaluate(board)  # Return board evaluation score if no win/loss
-
-    if maximizing_player:
-        # Maximizing player's turn
-        max_eval = float('-inf')  # Start with the lowest possible evaluation
-        for row in board:
-            for piece in row:
-                if isinstance(piece, Piece) and piece.color == BLUE:
-                    # For each blue piece, evaluate all possible moves
-                    for move in get_valid_moves(piece, board, mines):
-                        new_board = [list(r) for r in board]  # Create a copy of the board
-                        new_piece = Piece(move[0], move[1], piece.color)  # Create a new piece in the new position
-                        new_board[piece.row][piece.col], new_board[move[0]][move[1]] = 0, new_piece
-                        # Recursively call minimax for the next turn
-                        eval = minimax(new_board, depth - 1, alpha, beta, False, mines)
-                        max_eval = max(max_eval, eval)  # Update max_eval with the best score found
-                        alpha = max(alpha, eval)  # Update alpha with the best score for the maximizing player
-                        if beta <= alpha:
-                            break  # Beta cut-off: stop exploring this branch
-        return max_eval  # Return the best score for the maximizing player
+    if table is None:
+        table = new_transposition_table()
+    pieces, counts = _piece_lists(arr)
+    return _minimax_jit(arr, pieces, counts, depth, float(alpha), float(beta), maximizing_player, mines_mask, table)
 
-    else:
-        # Minimizing player's turn
-        min_eval = float('inf')  # Start with the highest possible evaluation
-        for row in board:
-            for piece in row:
-                if isinstance(piece, Piece) and piece.color == RED:
-                    # For each red piece, evaluate all possible moves
-                    for move in get_valid_moves(piece, board, mines):
-                        new_board = [list(r) for r in board]  # Create a copy of the board
-                        new_piece = Piece(move[0], move[1], piece.color)  # Create a new piece in the new position
-                        new_board[piece.row][piece.col], new_board[move[0]][move[1]] = 0, new_piece
-                        # Recursively call minimax for the next turn
-                        eval = minimax(new_board, depth - 1, alpha, beta, True, mines)
-                        min_eval = min(min_eval, eval)  # Update min_eval with the worst score found
-                        beta = min(beta, eval)  # Update beta with the best score for the minimizing player
-                        if beta <= alpha:
-                            break  # Alpha cut-off: stop exploring this branch
-        return min_eval  # Return the best score for the minimizing player
-
-def best_move(board, mines):
+def best_move(board_arr, pieces_by_color, mines_mask):
     """
     Determines the best move for the AI using the minimax algorithm.
 
+    The search is deepened one level at a time until MAX_DEPTH is reached, the
+    outcome is decided or AI_TIME_BUDGET has run out, and each level searches
+    the moves that scored best at the previous level first. Depths up to
+    MIN_DEPTH always complete; past it the clock is checked between root moves
+    and an unfinished depth is dropped in favor of the last completed one, so
+    the budget can be overrun by at most one root move's search.
+
     Parameters:
-    board (list): The current state of the board.
-    mines (set): The current set of mine coordinates.
+    board_arr (ndarray): The array copy of the board.
+    pieces_by_color (dict): Lists of the pieces on the board by color.
+    mines_mask (int): Bitmask of the current mine coordinates.
 
     Returns:
     tuple: The best piece and move for the AI, or None if no moves are found.
     """
-    best_moves = []
-    best_eval = float('-inf')
-    for row in board:
-        for piece in row:
-            if isinstance(piece, Piece) and piece.color == BLUE:
-                for move in get_valid_moves(piece, board, mines):
-                    new_board = [list(r) for r in board]
-                    new_piece = Piece(move[0], move[1], piece.color)
-                    new_board[piece.row][piece.col], new_board[move[0]][move[1]] = 0, new_piece
-                    eval = minimax(new_board, 3, float('-inf'), float('inf'), False, mines)
-                    if eval > best_eval:
-                        best_eval = eval
-                        best_moves = [(piece, move)]
-                    elif eval == best_eval:
-                        best_moves.append((piece, move))
-    return random.choice(best_moves) if best_moves else None
-
-def find_winning_move(board, mines):
+    table = new_transposition_table()  # Shared by all root moves, dropped after this turn
+    arr = board_arr.copy()  # Scratch board the search makes and unmakes moves on
+    root_moves = [(piece, move) for piece in pieces_by_color[BLUE]
+                  for move in get_array_moves(arr, piece.row, piece.col, mines_mask)]
+    if not root_moves:
+        return None
+
+    start = time.perf_counter()
+    for depth in range(1, MAX_DEPTH + 1):
+        best_eval = float('-inf')
+        evals = []
+        for piece, move in root_moves:
+            if depth > MIN_DEPTH and time.perf_counter() - start > AI_TIME_BUDGET:
+                return random.choice(best_moves)  # Out of time, keep the last completed depth
+            row, col = piece.row, piece.col
+            # Scores are whole numbers, so a window just below the best score still finds every tie
+            alpha = best_eval - 1 if best_eval != float('-inf') else best_eval
+            captured = arr[move]
+            arr[move], arr[row, col] = BLUE_PIECE, EMPTY
+            eval = minimax(arr, depth, alpha, float('inf'), False, mines_mask, table)
+            arr[row, col], arr[move] = BLUE_PIECE, captured
+            evals.append(eval)
+            best_eval = max(best_eval, eval)
+            if best_eval == float('inf'):
+                break  # Found a forced win, no other move can score higher
+        best_moves = [root_move for root_move, eval in zip(root_moves, evals) if eval == best_eval]
+        if best_eval in (float('inf'), float('-inf')):
+            break  # The game is decided
+        if depth >= MIN_DEPTH and time.perf_counter() - start > AI_TIME_BUDGET:
+            break  # No time for a deeper search
+        # Search the best moves of this depth first at the next depth
+        order = sorted(range(len(root_moves)), key=lambda i: evals[i], reverse=True)
+        root_moves = [root_moves[i] for i in order]
+    return random.choice(best_moves)
+
+def find_winning_move(board, pieces_by_color, mines_mask):
     """
     Finds a winning move for the AI.
 
     Parameters:
     board (list): The current state of the board.
-    mines (set): The current set of mine coordinates.
+    pieces_by_color (dict): Lists of the pieces on the board by color.
+    mines_mask (int): Bitmask of the current mine coordinates.
 
     Returns:
     tuple: The winning piece and move for the AI, or None if no winning move is found.
     """
-    for row in board:
-        for piece in row:
-            if isinstance(piece, Piece) and piece.color == BLUE:
-                for move in get_valid_moves(piece, board, mines):
-                    if move[0] == ROWS - 1:  # Check if the move leads to the last row
-                        return piece, move
+    for piece in pieces_by_color[BLUE]:
+        for move in get_valid_moves(piece, board, mines_mask):
+            if move[0] == ROWS - 1:  # Check if the move leads to the last row
+                return piece, move
     return None
 
 def blue_shuffle_condition(board, mines, eval_value):
@@ -432,39 +776,58 @@ def main():
     Main function to run the game loop.
     """
     board = create_board()  # Initialize the game board
+    board_arr = board_to_array(board)  # Array copy of the board for the AI search
+    pieces_by_color = group_pieces(board)  # Live pieces of each player
     mines = generate_mines(board)  # Place mines on the board
+    mines_mask = mines_to_mask(mines)  # Bitmask of the mines for move generation
 
     # Randomly decide which player (Red or Blue) starts
     turn = random.choice([RED, BLUE])
-    start_message = "Red" if turn == RED else "Blue"
 
     # Display who starts the game
     screen.fill(WHITE)  # Clear the screen with white color
-    start_text = FONT.render(f"After tossing the coin, {start_message} starts!", True, BLACK)
+    start_text = START_TEXTS[turn]
     screen.blit(start_text, (WIDTH // 2 - start_text.get_width() // 2, HEIGHT // 2 - start_text.get_height() // 2))
     pygame.display.flip()  # Update the display
-    pygame.time.wait(2000)  # Wait for 2 seconds to show the starting message
+    shown_at = pygame.time.get_ticks()
+    # Compile the AI search while the message is on screen rather than during the AI's first turn
+    minimax(board_arr.copy(), 1, float('-inf'), float('inf'), True, mines_mask)
+    pygame.time.wait(max(0, MESSAGE_MS - (pygame.time.get_ticks() - shown_at)))  # Keep the starting message on screen
 
     selected_piece = None  # Track the currently selected piece
     running = True  # Game loop flag
     red_shuffles = 2  # Number of reshuffles left for the red player
     blue_shuffles = 2  # Number of reshuffles left for the blue player
     blue_reshuffled = False  # Track if blue player has reshuffled this turn
+    clock = pygame.time.Clock()  # Caps the frame rate so idle frames don't burn CPU
+    dirty = [screen.get_rect()]  # Screen areas that changed since the last update
 
     while running:
-        for event in pygame.event.get():
+        # On the player's turn sleep until input arrives instead of spinning, then drain the queue
+        events = [pygame.event.wait(EVENT_WAIT_MS)] if turn == RED else []
+        events += pygame.event.get()
+        for event in events:
             if event.type == pygame.QUIT:
                 running = False  # Exit the game loop if the window is closed
 
+            if event.type in (pygame.WINDOWEXPOSED, pygame.VIDEOEXPOSE):
+                dirty.append(screen.get_rect())  # Repaint the whole window after it was covered or restored
+
             if event.type == pygame.MOUSEBUTTONDOWN:
                 pos = pygame.mouse.get_pos()  # Get the mouse click position
                 if RESHUFFLE_BTN.collidepoint(pos):
                     # Handle reshuffle button click
                     if turn == RED and red_shuffles > 0:
+                        dirty += [square_rect(r, c) for (r, c) in mines] + [PANEL_RECT]
                         mines = shuffle_mines(board, mines)  # Shuffle mines for Red player
+                        mines_mask = mines_to_mask(mines)
+                        dirty += [square_rect(r, c) for (r, c) in mines]
                         red_shuffles -= 1
                     elif turn == BLUE and blue_shuffles > 0 and not blue_reshuffled:
+                        dirty += [square_rect(r, c) for (r, c) in mines] + [PANEL_RECT]
                         mines = shuffle_mines(board, mines)  # Shuffle mines for Blue player
+                        mines_mask = mines_to_mask(mines)
+                        dirty += [square_rect(r, c) for (r, c) in mines]
                         blue_shuffles -= 1
                         blue_reshuffled = True
                 else:
@@ -474,23 +837,18 @@ def main():
                         if piece != 0 and piece.color == turn:
                             selected_piece = piece  # Select the piece if it belongs to the current player
                         elif selected_piece:
-                            if (row, col) in get_valid_moves(selected_piece, board, mines):
+                            if (row, col) in get_valid_moves(selected_piece, board, mines_mask):
                                 # Move the selected piece to the new position if the move is valid
-                                board[row][col] = selected_piece
-                                board[selected_piece.row][selected_piece.col] = 0
-                                selected_piece.move(row, col)
+                                dirty += [square_rect(selected_piece.row, selected_piece.col), square_rect(row, col)]
+                                move_piece(board, board_arr, pieces_by_color, selected_piece, row, col)
                                 selected_piece = None
                                 turn = BLUE if turn == RED else RED  # Switch turn
 
         # Check for win or lose conditions
-        win_message = check_win_condition(board)
-        if win_message:
-            show_message(win_message)  # Display win message
-            running = False
-
-        lose_message = check_no_pieces_left(board)
-        if lose_message:
-            show_message(lose_message)  # Display lose message
+        end_message = check_win_condition(board_arr) or check_no_pieces_left(board_arr)
+        if end_message:
+            draw_board(screen, board, mines, turn, red_shuffles, blue_shuffles)  # Show the final move first
+            show_message(end_message)  # Display win or lose message
             running = False
 
         # AI move for Blue player
@@ -498,27 +856,28 @@ def main():
             if blue_reshuffled:
                 blue_reshuffled = False
             else:
-                winning_move = find_winning_move(board, mines)
+                winning_move = find_winning_move(board, pieces_by_color, mines_mask)
                 if winning_move:
                     # Execute the winning move if available
                     piece, move = winning_move
-                    board[move[0]][move[1]] = piece
-                    board[piece.row][piece.col] = 0
-                    piece.move(move[0], move[1])
+                    dirty += [square_rect(piece.row, piece.col), square_rect(move[0], move[1])]
+                    move_piece(board, board_arr, pieces_by_color, piece, move[0], move[1])
                     turn = RED  # Switch turn to Red player
                 else:
                     # Determine the best move using the minimax algorithm
-                    best = best_move(board, mines)
+                    best = best_move(board_arr, pieces_by_color, mines_mask)
                     if best:
                         piece, move = best
-                        board[move[0]][move[1]] = piece
-                        board[piece.row][piece.col] = 0
-                        piece.move(move[0], move[1])
+                        dirty += [square_rect(piece.row, piece.col), square_rect(move[0], move[1])]
+                        move_piece(board, board_arr, pieces_by_color, piece, move[0], move[1])
                         turn = RED  # Switch turn to Red player
 
-        # Draw the board and update the display
-        draw_board(screen, board, mines, turn, red_shuffles, blue_shuffles)
-        pygame.display.flip()  # Refresh the display
+        # Redraw only when something changed and push only the changed areas to the display
+        if dirty:
+            draw_board(screen, board, mines, turn, red_shuffles, blue_shuffles)
+            pygame.display.update(dirty)
+            dirty.clear()
+        clock.tick(FPS)
 
     pygame.quit()  # Quit Pygame
     sys.exit()  # Exit the program